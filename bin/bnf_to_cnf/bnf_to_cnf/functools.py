@@ -6,11 +6,11 @@ from typing import (
 
 
 def exists(it: Iterator) -> bool:
-    try:
-        next(it)
-    except StopIteration:
-        return False
-    return True
+    # Most of the filters passed in here are generators, so
+    # avoid raising and catching StopIteration on a miss.
+    for _ in it:
+        return True
+    return False
 
 
 T = TypeVar('T')
@@ -69,6 +69,14 @@ NONTERMINAL_NODES = {
 
 class Node(object):
 
+    __slots__ = (
+        'node_type',
+        'value',
+        'children',
+        'cached_symbols',
+        'probability',
+    )
+
     def __init__(self,
                  node_type: NodeType,
                  value: Optional[str] = None,
@@ -143,10 +151,14 @@ class Node(object):
 
     def _bfs(self) -> Iterator['Node']:
         queue = deque([self])
+        # Every filter goes through here, so avoid the attribute
+        # lookups, and push the children in a single call.
+        # (extendleft is equivalent to appendleft for each child.)
+        pop = queue.pop
+        extendleft = queue.extendleft
         while queue:
-            current = queue.pop()
-            for child in current.children:
-                queue.appendleft(child)
+            current = pop()
+            extendleft(current.children)
             yield current
 
     def walk(self) -> Iterator['Node']:
@@ -169,24 +181,28 @@ class Node(object):
         for production in self.filter(
             lambda x: x.node_type == NodeType.PRODUCTION
         ):
-            has_annotation = (
-                len(production.children) > 1
-                and Node.is_annotations(production.children[1])
-            )
-            if has_annotation:
-                assert production.children[1].value, (
-                    'The productions must have a symbol value.'
-                )
-                symbol = production.children[1].value
-            else:
-                assert production.children[0].value, (
-                    'The productions must have a symbol value.'
-                )
-                symbol = production.children[0].value
-            self.cached_symbols.add(symbol or '')
+            self.cached_symbols.add(Node._defined_symbol(production))
 
         return value in self.cached_symbols
 
+    @staticmethod
+    def _defined_symbol(production: 'Node') -> str:
+        has_annotation = (
+            len(production.children) > 1
+            and Node.is_annotations(production.children[1])
+        )
+        if has_annotation:
+            assert production.children[1].value, (
+                'The productions must have a symbol value.'
+            )
+            symbol = production.children[1].value
+        else:
+            assert production.children[0].value, (
+                'The productions must have a symbol value.'
+            )
+            symbol = production.children[0].value
+        return symbol or ''
+
     def equals(self, other: Any) -> bool:
         if type(other) != type(self):
             return False
@@ -364,12 +380,27 @@ class Node(object):
     def _invalidate_cache(self):
         self.cached_symbols = set()
 
+    def _update_cache(self, node: 'Node'):
+        # If the symbols have already been cached, and we're adding
+        # a production to the grammar, we can just add its symbol,
+        # rather than rebuilding the whole cache.
+        can_update = (
+            self.cached_symbols
+            and self.node_type == NodeType.GRAMMAR
+            and node.node_type == NodeType.PRODUCTION
+            and node.children
+        )
+        if can_update:
+            self.cached_symbols.add(Node._defined_symbol(node))
+        else:
+            self._invalidate_cache()
+
     def append(self, node: 'Node'):
-        self._invalidate_cache()
+        self._update_cache(node)
         self.children.append(node)
 
     def prepend(self, node: 'Node'):
-        self._invalidate_cache()
+        self._update_cache(node)
         self.children.insert(0, node)
 
     def clone(self) -> 'Node':
@@ -608,6 +639,18 @@ class Node(object):
             return x.children[0].value == symbol
         return _inner
 
+    @staticmethod
+    def _production_with_lhs_in(
+        symbols: Set[str]
+    ) -> Callable[['Node'], bool]:
+        def _inner(x: Node) -> bool:
+            if not Node.is_production(x):
+                return False
+            if not x.children or not Node.is_symbol(x.children[0]):
+                return False
+            return x.children[0].value in symbols
+        return _inner
+
     @staticmethod
     def has_annotation(node: 'Node') -> bool:
         return exists(node.filter(Node.is_annotations))
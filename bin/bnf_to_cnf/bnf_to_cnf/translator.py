@@ -2,6 +2,9 @@ from collections import (
     defaultdict,
     deque,
 )
+from functools import (
+    lru_cache,
+)
 import re
 from typing import (
     Callable,
@@ -23,13 +26,13 @@ from .node import (
 from .functools import (
     exists,
     and_,
-    or_,
 )
 
 
 END_DIGIT = re.compile(r'\d+$')
 
 
+@lru_cache(maxsize=None)
 def to_symbol(value: str, count: int = None) -> str:
     """Given a terminal value, produce an adquate symbol.
 
@@ -64,6 +67,17 @@ def to_symbol(value: str, count: int = None) -> str:
 class Translator(object):
     """Transforms a BNF tree to CNF."""
 
+    def __init__(self):
+        self._parser = None  # type: Optional[Parser]
+
+    def _get_parser(self) -> Parser:
+        # Building the Lark parser is comparatively expensive, and
+        # we parse many small productions during translation, so
+        # only build it once.
+        if self._parser is None:
+            self._parser = Parser()
+        return self._parser
+
     def _reassign_start(self, tree: Node, start_symbol: Optional[Node]):
         """Factor out the start symbol from the RHS.
 
@@ -122,7 +136,7 @@ class Translator(object):
             for symbol in seq.filter(is_start_node):
                 symbol.value = f'{start_value}{start_suffix}'
 
-        new_production = Parser().parse_production(
+        new_production = self._get_parser().parse_production(
             f'<{start_value}> ::= <{start_value}{start_suffix}>'
         )
         if annotations:
@@ -180,7 +194,7 @@ class Translator(object):
                         replacement = to_symbol(terminal.value, i)
                         i += 1
                     tree.append(
-                        Parser().parse_production(
+                        self._get_parser().parse_production(
                             f'<{replacement}> ::= {terminal.value}'
                         )
                     )
@@ -214,46 +228,47 @@ class Translator(object):
         for sequence in production.filter(Node.is_sequence):
             if len(sequence.children) <= 2:
                 continue
-            while grammar.defines(f'{name}{i}'):
-                i += 1
-            new_children = [
-                sequence.children[0],
-                Node(
-                    NodeType.SYMBOL,
-                    value=f'{name}{i}'
-                )
-            ]
-            old_children = sequence.children[1:]
-            sequence.children = new_children
-            new_sequence = Node(
-                NodeType.EXPRESSION,
-                children=[
-                    Node(
-                        NodeType.SEQUENCE,
-                        children=old_children,
-                    )
-                ]
-            )
-            new_production = Node(
-                NodeType.PRODUCTION,
-                children=[
+
+            # Peel the symbols off of the front of the sequence, one
+            # at a time, chaining each remainder through a new
+            # production.  We build each link directly, rather than
+            # slicing the remainder and recursing on it.
+            children = sequence.children
+            current = sequence
+            for child in children[:-2]:
+                while grammar.defines(f'{name}{i}'):
+                    i += 1
+                current.children = [
+                    child,
                     Node(
                         NodeType.SYMBOL,
                         value=f'{name}{i}'
-                    ),
-                    new_sequence
+                    )
                 ]
-            )
-            grammar.append(new_production)
-
-            # We call recursively, because there may have been
-            # more than three symbols on the RHS.
-            self._break_sequences_up(grammar, new_production)
+                current = Node(
+                    NodeType.SEQUENCE,
+                    children=list(),
+                )
+                new_production = Node(
+                    NodeType.PRODUCTION,
+                    children=[
+                        Node(
+                            NodeType.SYMBOL,
+                            value=f'{name}{i}'
+                        ),
+                        Node(
+                            NodeType.EXPRESSION,
+                            children=[current],
+                        ),
+                    ]
+                )
+                grammar.append(new_production)
+            current.children = children[-2:]
 
     def _eliminate_rhs_with_3plus_symbols(self, tree: Node):
         # We capture all productions before the transformation:
-        # since the breaking up is recursive, we don't have to
-        # worry about new productions.
+        # since each sequence is broken up completely, we don't
+        # have to worry about new productions.
         #
         # Productions which do not have RHSs which are too
         # long won't be affected.
@@ -307,18 +322,28 @@ class Translator(object):
             including the original sequence.
 
         """
+        occurrences = len([x for x in sequence.children if x.value == symbol])
+
         def from_bitmask(mask: int) -> Node:
-            i = len(sequence.children) - 1
-            mask_index = 0
-            new_sequence = sequence.clone()
-            while i >= 0:
-                matches = new_sequence.children[i].value == symbol
-                if matches:
+            # Build the new sequence directly from the included
+            # children, rather than cloning the whole sequence and
+            # popping the excluded ones.  The lowest bit of the mask
+            # corresponds to the last occurrence of the symbol.
+            children = list()  # type: List[Node]
+            mask_index = occurrences
+            for child in sequence.children:
+                if child.value == symbol:
+                    mask_index -= 1
                     include = (mask >> mask_index) & 1
                     if not include:
-                        new_sequence.children.pop(i)
-                    mask_index += 1
-                i -= 1
+                        continue
+                children.append(child.clone())
+            new_sequence = Node(
+                node_type=sequence.node_type,
+                value=sequence.value,
+                children=children,
+                probability=sequence.probability,
+            )
 
             # FIXME This results in a never-ending list if
             # a symbol is self-referencing with optional symbol.
@@ -337,7 +362,6 @@ class Translator(object):
 
             return new_sequence
 
-        occurrences = len([x for x in sequence.children if x.value == symbol])
         for mask in range(2**occurrences - 1):
             yield from_bitmask(mask)
 
@@ -516,6 +540,7 @@ class Translator(object):
             unit_productions.remove(production)
             unit_sequences = list(production.filter(is_unit_sequence))
             production.remove(is_unit_sequence)
+            expression = next(production.filter(Node.is_expression))
             for unit_sequence in unit_sequences:
                 if Node.is_annotations(unit_sequence.children[0]):
                     probability = unit_sequence.probability
@@ -527,7 +552,6 @@ class Translator(object):
                     symbol = unit_sequence.children[0].value
                 simplify(lookup[symbol])
                 for sequence in lookup[symbol].filter(Node.is_sequence):
-                    expression = next(production.filter(Node.is_expression))
                     if not Node.has_sequence(expression, sequence):
                         cloned = sequence.clone()
                         cloned.probability = probability or cloned.probability
@@ -535,8 +559,10 @@ class Translator(object):
                             cloned.merge_annotations(annotations)
                         expression.children.append(cloned)
 
+        # Take an arbitrary production from the worklist, without
+        # copying the whole set into a list on every iteration.
         while unit_productions:
-            head = list(unit_productions)[0]
+            head = next(iter(unit_productions))
             simplify(head)
 
     def _build_adjacency_matrix(self, tree: Node) -> Dict[str, Set[str]]:
@@ -549,8 +575,17 @@ class Translator(object):
             A graph of the grammar represented in the BNF.
 
         """
+        # Productions only occur at the top level of the grammar, and
+        # expressions only contain sequences, so we can walk the tree
+        # directly, rather than filtering it at each level.
+        production_type = NodeType.PRODUCTION
+        expression_type = NodeType.EXPRESSION
+        leaf_types = {NodeType.SYMBOL, NodeType.TERMINAL}
+
         graph = dict()  # type: Dict[str, Set[str]]
-        for production in tree.filter(Node.is_production):
+        for production in tree.children:
+            if production.node_type != production_type:
+                continue
             has_annotations = Node.is_annotations(production.children[0])
             if has_annotations:
                 symbol = production.children[1].value
@@ -559,13 +594,17 @@ class Translator(object):
             assert symbol is not None
             if symbol not in graph:
                 graph[symbol] = set()
+            children = graph[symbol]
 
-            expression = next(production.filter(Node.is_expression))
-            for child in expression.filter(
-                or_(Node.is_symbol, Node.is_terminal)
-            ):
-                assert child.value is not None
-                graph[symbol].add(child.value)
+            expression = next(
+                x for x in production.children
+                if x.node_type == expression_type
+            )
+            for sequence in expression.children:
+                for child in sequence.children:
+                    if child.node_type in leaf_types:
+                        assert child.value is not None
+                        children.add(child.value)
 
         return graph
 
@@ -598,8 +637,8 @@ class Translator(object):
 
         # Remove all non-encountered nodes.
         to_remove = set(graph.keys()) - encountered
-        for production_symbol in to_remove:
-            tree.remove(Node._production_with_lhs(production_symbol))
+        if to_remove:
+            tree.remove(Node._production_with_lhs_in(to_remove))
 
     def _remove_remaining_imports(self, tree: Node):
         assert tree.node_type == NodeType.GRAMMAR
@@ -628,22 +667,31 @@ class Translator(object):
 
         graph = self._build_adjacency_matrix(tree)
 
-        def _dfs(node, encountered=set()):
+        def _dfs(node, encountered=None):
+            # We share a single set of encountered nodes across the
+            # whole search, rather than copying it for each branch.
+            if encountered is None:
+                encountered = {node}
             for child in graph.get(node, []):
                 if child in encountered:
                     continue
-                yield from _dfs(child, encountered | {node, child})
+                encountered.add(child)
+                yield from _dfs(child, encountered)
             yield node
 
         terminals = {x.value for x in tree.filter(Node.is_terminal)}
 
+        # The graph doesn't change while we're pruning, so whether
+        # a symbol is fruitful only has to be determined once.
+        fruitful = dict()  # type: Dict[str, bool]
+
         def is_fruitful(node):
-            if node in terminals:
-                return True
-            for child in _dfs(node):
-                if child in terminals:
-                    return True
-            return False
+            if node in fruitful:
+                return fruitful[node]
+            fruitful[node] = node in terminals or any(
+                child in terminals for child in _dfs(node)
+            )
+            return fruitful[node]
 
         changed = True
         while changed:
@@ -167,3 +167,13 @@ class NodeTest(TestCase):
             '([], "A", "A", 70)',
             node.children[0].children[1].children[0].to_python(),
         )
+
+    def test_defines_appended_productions(self):
+        parser = Parser()
+        node = parser.parse('<A> ::= "A"')
+        self.assertTrue(node.defines('A'))
+        self.assertFalse(node.defines('B'))
+        node.append(parser.parse_production('<B> ::= "B"'))
+        self.assertTrue(node.defines('B'))
+        node.prepend(parser.parse_production('<C> ::= "C"'))
+        self.assertTrue(node.defines('C'))
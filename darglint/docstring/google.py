@@ -1,6 +1,5 @@
 from collections import (
     defaultdict,
-    deque,
 )
 from typing import (  # noqa: F401
     Callable,
@@ -54,8 +53,8 @@ class _CykVisitor(object):
     """
 
     def __init__(self, root):
-        self.stack = deque([root])
-        self.marks = deque([])
+        self.stack = [root]
+        self.marks = list()  # type: List[str]
 
     def __iter__(self):
         return self
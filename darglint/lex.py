@@ -68,17 +68,14 @@ def _is_hyphen(char):
     return char == '-'
 
 
+# The single characters which end a word.  (Separators are
+# handled separately, since they're any other whitespace.)
+_NON_WORD_CHARACTERS = {' ', '\n', ':', '#', '(', ')'}
+
+
 def _is_word(char):
     # type: (str) -> bool
-    return not any([
-        _is_space(char),
-        _is_newline(char),
-        _is_colon(char),
-        _is_separator(char),
-        _is_hash(char),
-        _is_lparen(char),
-        _is_rparen(char),
-    ])
+    return not (char in _NON_WORD_CHARACTERS or _is_separator(char))
 
 
 def lex(program):
@@ -97,34 +94,35 @@ def lex(program):
     line_number = 0
 
     # Set the amount of spaces which count as an indent.
-    config = get_config()
+    indentation = get_config().indentation
 
     while peaker.has_next():
         # Each of the following conditions must move the stream
         # forward and -- excepting separators -- yield a token.
-        if _is_space(peaker.peak()):
+        char = peaker.peak()
+        if _is_space(char):
             spaces = ''.join(peaker.take_while(_is_space))
-            for _ in range(len(spaces) // config.indentation):
+            for _ in range(len(spaces) // indentation):
                 yield Token(' ' * 4, TokenType.INDENT, line_number)
-        elif _is_newline(peaker.peak()):
+        elif _is_newline(char):
             value = peaker.next()
             yield Token(value, TokenType.NEWLINE, line_number)
             line_number += 1
-        elif _is_colon(peaker.peak()):
+        elif _is_colon(char):
             value = peaker.next()
             yield Token(value, TokenType.COLON, line_number)
-        elif _is_separator(peaker.peak()):
+        elif _is_separator(char):
             peaker.take_while(_is_separator)
-        elif _is_hash(peaker.peak()):
+        elif _is_hash(char):
             value = peaker.next()
             yield Token(value, TokenType.HASH, line_number)
-        elif _is_lparen(peaker.peak()):
+        elif _is_lparen(char):
             value = peaker.next()
             yield Token(value, TokenType.LPAREN, line_number)
-        elif _is_rparen(peaker.peak()):
+        elif _is_rparen(char):
             value = peaker.next()
             yield Token(value, TokenType.RPAREN, line_number)
-        elif _is_hyphen(peaker.peak()):
+        elif _is_hyphen(char):
             value = ''.join(peaker.take_while(_is_word))
             if value.count('-') == len(value):
                 yield Token(value, TokenType.HEADER, line_number)
@@ -25,6 +25,16 @@ MAX_TREE_HEIGHT = 300
 class CykNode(object):
     """A node for use in a cyk parse."""
 
+    __slots__ = (
+        'symbol',
+        'lchild',
+        'rchild',
+        'value',
+        'annotations',
+        'weight',
+        '_line_number_cache',
+    )
+
     def __init__(self,
                  symbol,
                  lchild=None,
@@ -83,11 +93,17 @@ class CykNode(object):
 
     def in_order_traverse(self):
         # type: () -> Iterator[CykNode]
-        if self.lchild:
-            yield from self.lchild.in_order_traverse()
-        yield self
-        if self.rchild:
-            yield from self.rchild.in_order_traverse()
+        # Use an explicit stack, rather than recursing, so that each
+        # node isn't passed up through a generator per level.
+        stack = list()  # type: List[CykNode]
+        curr = self  # type: Optional[CykNode]
+        while stack or curr:
+            while curr:
+                stack.append(curr)
+                curr = curr.lchild
+            curr = stack.pop()
+            yield curr
+            curr = curr.rchild
 
     def breadth_first_walk(self):
         queue = deque([self])
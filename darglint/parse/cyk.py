@@ -17,8 +17,11 @@ article, https://en.wikipedia.org/wiki/CYK_algorithm.
 """
 
 from typing import (
+    Any,
+    Dict,
     Optional,
     List,
+    Tuple,
 )
 
 from .grammar import (
@@ -26,61 +29,174 @@ from .grammar import (
 )
 from ..token import (
     Token,
+    TokenType,
 )
 from ..node import (
     CykNode,
 )
 
 
+# A non-terminal derivation, with its symbols resolved to indices:
+# (index, lhs, annotations, left index, right index, weight).
+ResolvedNonTerminal = Tuple[int, str, List[Any], int, int, int]
+
+# A terminal derivation: (index, lhs, weight).
+ResolvedTerminal = Tuple[int, str, int]
+
+Derivations = Tuple[
+    List[ResolvedNonTerminal],
+    List[List[int]],
+    Dict[TokenType, List[ResolvedTerminal]],
+    int,
+]
+
+# The derivation tables computed for each grammar.  Grammars are
+# defined statically, so the tables can be reused between parses.
+_derivation_cache = dict()  # type: Dict[Any, Derivations]
+
+
+def _get_derivations(grammar):
+    # type: (BaseGrammar) -> Derivations
+    if grammar in _derivation_cache:
+        return _derivation_cache[grammar]
+
+    lookup = grammar.get_symbol_lookup()
+
+    # Resolve the symbols in each non-terminal derivation to their
+    # indices once, so that the inner loop doesn't have to hash
+    # strings.  The derivations of all productions are kept in a
+    # single flat list, in production order, so the inner loop is
+    # one pass over it.
+    nonterminal_derivations = list()  # type: List[ResolvedNonTerminal]
+    for a, production in enumerate(grammar.productions):
+        for derivation in production.rhs:
+            if len(derivation) <= 2:
+                continue
+
+            # TODO: Cast the derivation to a NonTerminalDerivation?
+            annotations, B, C, weight = derivation  # type: ignore
+            nonterminal_derivations.append((
+                a,
+                production.lhs,
+                annotations,
+                lookup[B],
+                lookup[C],
+                weight,
+            ))
+
+    # The indices of the non-terminal derivations, by the index of
+    # their left symbol.  Only the derivations whose left symbol is
+    # present in a cell have to be checked against it.
+    left_derivations = [
+        list() for _ in grammar.productions
+    ]  # type: List[List[int]]
+    for i, derivation in enumerate(nonterminal_derivations):
+        left_derivations[derivation[3]].append(i)
+
+    # Group the terminal derivations by the token type they match,
+    # so that each token only visits the productions which can
+    # derive it.
+    terminal_derivations = dict()  # type: Dict[TokenType, List[ResolvedTerminal]]  # noqa: E501
+    for v, production in enumerate(grammar.productions):
+        for rhs in production.rhs:
+            if len(rhs) > 2:
+                continue
+
+            # TODO: Cast to a TerminalDerivation?
+            token_type, weight = rhs  # type: ignore
+            if token_type not in terminal_derivations:
+                terminal_derivations[token_type] = list()
+            terminal_derivations[token_type].append(
+                (v, production.lhs, weight)
+            )
+
+    _derivation_cache[grammar] = (
+        nonterminal_derivations,
+        left_derivations,
+        terminal_derivations,
+        lookup[grammar.start],
+    )
+    return _derivation_cache[grammar]
+
+
 def parse(grammar, tokens):
     # type: (BaseGrammar, List[Token]) -> Optional[CykNode]
     if not tokens:
         return None
     n = len(tokens)
     r = len(grammar.productions)
+
+    # P[l - 1][s - 1] holds the derivations of the span of length l
+    # starting at s.  There are only n - l + 1 such spans, so the
+    # chart is triangular.
     P = [
-        [[None for _ in range(r)] for _ in range(n)]
-        for _ in range(n)
+        [[None] * r for _ in range(n - i)]
+        for i in range(n)
     ]  # type: List[List[List[Optional[CykNode]]]]
-    lookup = grammar.get_symbol_lookup()
+
+    # The indices of the symbols present in each cell of P, so that
+    # we don't have to scan every production to find them.
+    populated = [
+        [list() for _ in range(n - i)]
+        for i in range(n)
+    ]  # type: List[List[List[int]]]
+    (
+        nonterminal_derivations,
+        left_derivations,
+        terminal_derivations,
+        start,
+    ) = _get_derivations(grammar)
+
+    # The candidate derivations for a left cell depend only on the
+    # symbols present in it, and the same few combinations come up
+    # over and over, so remember them.
+    candidate_cache = dict()  # type: Dict[Tuple[int, ...], List[int]]
+
     for s, token in enumerate(tokens):
-        for v, production in enumerate(grammar.productions):
-            for rhs in production.rhs:
-                if len(rhs) > 2:
-                    continue
-
-                # TODO: Cast to a TerminalDerivation?
-                token_type, weight = rhs  # type: ignore
-                if token.token_type == token_type:
-                    P[0][s][v] = CykNode(
-                        production.lhs,
-                        value=token,
-                        weight=weight,
-                    )
+        for v, lhs, weight in terminal_derivations.get(token.token_type, []):
+            if P[0][s][v] is None:
+                populated[0][s].append(v)
+            P[0][s][v] = CykNode(
+                lhs,
+                value=token,
+                weight=weight,
+            )
     for l in range(2, n + 1):
-        for s in range(n - l + 2):
-            for p in range(l):
-                for a, production in enumerate(grammar.productions):
-                    for derivation in production.rhs:
-                        is_terminal_derivation = len(derivation) <= 2
-                        if is_terminal_derivation:
-                            continue
+        for s in range(1, n - l + 2):
+            for p in range(1, l):
+                left = P[p - 1][s - 1]
+                right = P[l - p - 1][s + p - 1]
+                current = P[l - 1][s - 1]
+                current_populated = populated[l - 1][s - 1]
 
-                        # TODO: Cast the derivation to a NonTerminalDerivation?
-                        annotations, B, C, weight = derivation  # type: ignore
-                        b = lookup[B]
-                        c = lookup[C]
-                        lchild = P[p - 1][s - 1][b]
-                        rchild = P[l - p - 1][s + p - 1][c]
-                        if lchild and rchild:
-                            old = P[l - 1][s - 1][a]
-                            if old and old.weight > weight:
-                                continue
-                            P[l - 1][s - 1][a] = CykNode(
-                                production.lhs,
-                                lchild,
-                                rchild,
-                                annotations=annotations,
-                                weight=weight,
-                            )
-    return P[n - 1][0][lookup[grammar.start]]
+                # The derivations have to be tried in their original
+                # order, since that determines which of equally
+                # weighted derivations wins.
+                key = tuple(populated[p - 1][s - 1])
+                if key not in candidate_cache:
+                    candidates = [
+                        i
+                        for b in key
+                        for i in left_derivations[b]
+                    ]
+                    candidates.sort()
+                    candidate_cache[key] = candidates
+                for i in candidate_cache[key]:
+                    a, lhs, annotations, b, c, weight = (
+                        nonterminal_derivations[i]
+                    )
+                    rchild = right[c]
+                    if rchild:
+                        old = current[a]
+                        if old and old.weight > weight:
+                            continue
+                        if old is None:
+                            current_populated.append(a)
+                        current[a] = CykNode(
+                            lhs,
+                            left[b],
+                            rchild,
+                            annotations=annotations,
+                            weight=weight,
+                        )
+    return P[n - 1][0][start]
@@ -125,6 +125,30 @@ def top_parse(tokens):
     return all_sections
 
 
+# The grammars to try for each section, keyed by the type of
+# the token which begins the section.
+_TT_LOOKUP = {
+    TokenType.RETURNS: [
+        ReturnsGrammar,
+        ReturnsWithoutTypeGrammar,
+        long_description_parse,
+    ],
+    TokenType.ARGUMENTS: [
+        ArgumentsGrammar,
+        long_description_parse,
+    ],
+    TokenType.YIELDS: [
+        YieldsGrammar,
+        YieldsWithoutTypeGrammar,
+        long_description_parse,
+    ],
+    TokenType.RAISES: [
+        RaisesGrammar,
+        long_description_parse,
+    ],
+}
+
+
 def _match(token):
     """Match the given token from the given section to a set of grammars.
 
@@ -136,27 +160,7 @@ def _match(token):
         A list of grammars to be tried in order.
 
     """
-    tt_lookup = {
-        TokenType.RETURNS: [
-            ReturnsGrammar,
-            ReturnsWithoutTypeGrammar,
-            long_description_parse,
-        ],
-        TokenType.ARGUMENTS: [
-            ArgumentsGrammar,
-            long_description_parse,
-        ],
-        TokenType.YIELDS: [
-            YieldsGrammar,
-            YieldsWithoutTypeGrammar,
-            long_description_parse,
-        ],
-        TokenType.RAISES: [
-            RaisesGrammar,
-            long_description_parse,
-        ],
-    }
-    return tt_lookup.get(token.token_type, [long_description_parse])
+    return _TT_LOOKUP.get(token.token_type, [long_description_parse])
 
 
 def lookup(section, section_index=-1):
@@ -1,6 +1,7 @@
 """Defines a base class far describing grammars."""
 
 import abc
+import io
 from typing import (  # noqa: F401
     Any,
     Dict,
@@ -85,8 +86,14 @@ class BaseGrammar(abc.ABC):
     def to_dot(cls):
         # () -> str
 
+        # The same symbols appear in many derivations, so remember
+        # their normalized names.
+        normalized = dict()  # type: Dict[str, str]
+
         def normalize(name):
-            return name.replace('-', '_').replace('.', '_')
+            if name not in normalized:
+                normalized[name] = name.replace('-', '_').replace('.', '_')
+            return normalized[name]
 
         def interpolate(curr, max_weight):
             min_color = (200, 200, 200)
@@ -113,14 +120,15 @@ class BaseGrammar(abc.ABC):
                         max_weight = derivation[-1]
 
         join_count = 0
-        ret = 'digraph G {\n'
+        ret = io.StringIO()
+        ret.write('digraph G {\n')
         for production in cls.productions:
             lhs = normalize(production.lhs)
             for derivation in production.rhs:
                 if len(derivation) == 2:
                     rhs = normalize(str(derivation[0]))
                     color = to_hex(interpolate(0, max_weight))
-                    ret += (
+                    ret.write(
                         '  {} -> {} [color="{}"];\n\n'.format(
                             lhs,
                             rhs,
@@ -137,33 +145,33 @@ class BaseGrammar(abc.ABC):
                         node_color = '#c8e6c9'
                         if any(['error' in x.lower() for x in annotations]):
                             node_color = '#ffcdd2'
-                        ret += (
+                        ret.write(
                             '  {} [label="{}", shape="rect", '
-                            'style="filled", fillcolor="{}"]\n'
-                        ).format(
-                            join_node,
-                            '\\n'.join(annotations),
-                            node_color,
+                            'style="filled", fillcolor="{}"]\n'.format(
+                                join_node,
+                                '\\n'.join(annotations),
+                                node_color,
+                            )
                         )
                     else:
-                        ret += (
+                        ret.write(
                             '  {} [label="", color="none", '
-                            'height="0", width="0"];\n'
-                        ).format(join_node)
-                    ret += (
-                        '  {} -> {} [arrowhead="none", color="{}"];\n'
-                    ).format(
-                        lhs,
-                        join_node,
-                        color,
+                            'height="0", width="0"];\n'.format(join_node)
+                        )
+                    ret.write(
+                        '  {} -> {} [arrowhead="none", color="{}"];\n'.format(
+                            lhs,
+                            join_node,
+                            color,
+                        )
                     )
-                    ret += (
-                        '  {} -> {{ {}, {} }} [color="{}"];\n\n'
-                    ).format(
-                        join_node,
-                        normalize(derivation[1]),
-                        normalize(derivation[2]),
-                        color,
+                    ret.write(
+                        '  {} -> {{ {}, {} }} [color="{}"];\n\n'.format(
+                            join_node,
+                            normalize(derivation[1]),
+                            normalize(derivation[2]),
+                            color,
+                        )
                     )
-        ret += '}'
-        return ret
+        ret.write('}')
+        return ret.getvalue()
@@ -211,10 +211,13 @@ class Identifier(abc.ABC):
         # type: (CykNode) -> str
         # TODO: Fix the type annotation here.
         value = cls.path.extract(node)  # type: ignore
-        Assert(
-            value is not None,
-            'Failed to extract {}'.format(cls.key)
-        )
+        if value is None:
+            # Only format the message if the extraction failed, since
+            # this is called for every identified node.
+            Assert(
+                False,
+                'Failed to extract {}'.format(cls.key)
+            )
         return value or ''
 
     def __str__(self):
@@ -33,10 +33,10 @@ def _is(peaker, token_type, index=1):
 
 def _are(peaker, *token_types):
     # type: (Peaker[Token], Optional[TokenType]) -> bool
-    return all([
-        _is(peaker, token_type, i + 1)
-        for i, token_type in enumerate(token_types)
-    ])
+    for i, token_type in enumerate(token_types):
+        if not _is(peaker, token_type, i + 1):
+            return False
+    return True
 
 
 def _parse_noqa_head(peaker):
@@ -71,7 +71,7 @@ def _last_node(node):
 
 
 def foldr(fun, xs, acc):
-    return reduce(lambda x, y: fun(y, x), xs[::-1], acc)
+    return reduce(lambda x, y: fun(y, x), reversed(xs), acc)
 
 
 def _parse_words_until_newline_or_end(peaker):
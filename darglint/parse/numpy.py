@@ -145,6 +145,51 @@ def top_parse(tokens):
     return overall
 
 
+# The grammars to try for each section, keyed by the type of
+# the token which begins the section.
+_TT_LOOKUP = {
+    TokenType.RETURNS: [
+        ReturnsGrammar,
+        long_description_parse,
+    ],
+    TokenType.ARGUMENTS: [
+        ArgumentsGrammar,
+        long_description_parse,
+    ],
+    TokenType.YIELDS: [
+        YieldsGrammar,
+        long_description_parse,
+    ],
+    TokenType.RAISES: [
+        RaisesGrammar,
+        long_description_parse,
+    ],
+    TokenType.WARNS: [
+        WarnsGrammar,
+        long_description_parse,
+    ],
+    TokenType.RECEIVES: [
+        ReceivesGrammar,
+        long_description_parse,
+    ],
+    TokenType.OTHER: [
+        OtherArgumentsGrammar,
+        long_description_parse,
+    ],
+    # Discard these two sections -- there's nothing
+    # to check against the function description.
+    TokenType.SEE: [
+        long_description_parse,
+    ],
+    TokenType.NOTES: [
+        long_description_parse,
+    ],
+    TokenType.EXAMPLES: [
+        long_description_parse,
+    ],
+}  # type: Dict[TokenType, List[Union[BaseGrammar, Callable]]]  # noqa: E501
+
+
 def _match(token):
     # type: (Token) -> List[Union[Callable, BaseGrammar]]
     """Match the given token from the given section to a set of grammars.
@@ -157,48 +202,7 @@ def _match(token):
         A list of grammars to be tried in order.
 
     """
-    tt_lookup = {
-        TokenType.RETURNS: [
-            ReturnsGrammar,
-            long_description_parse,
-        ],
-        TokenType.ARGUMENTS: [
-            ArgumentsGrammar,
-            long_description_parse,
-        ],
-        TokenType.YIELDS: [
-            YieldsGrammar,
-            long_description_parse,
-        ],
-        TokenType.RAISES: [
-            RaisesGrammar,
-            long_description_parse,
-        ],
-        TokenType.WARNS: [
-            WarnsGrammar,
-            long_description_parse,
-        ],
-        TokenType.RECEIVES: [
-            ReceivesGrammar,
-            long_description_parse,
-        ],
-        TokenType.OTHER: [
-            OtherArgumentsGrammar,
-            long_description_parse,
-        ],
-        # Discard these two sections -- there's nothing
-        # to check against the function description.
-        TokenType.SEE: [
-            long_description_parse,
-        ],
-        TokenType.NOTES: [
-            long_description_parse,
-        ],
-        TokenType.EXAMPLES: [
-            long_description_parse,
-        ],
-    }  # type: Dict[TokenType, List[Union[BaseGrammar, Callable]]]  # noqa: E501
-    return tt_lookup.get(token.token_type, [long_description_parse])
+    return _TT_LOOKUP.get(token.token_type, [long_description_parse])
 
 
 def lookup(section, section_index=-1):
@@ -85,6 +85,48 @@ def top_parse(tokens):
     return all_sections
 
 
+# The grammars to try for each section, keyed by the type of
+# the token which begins the section.
+_TT_LOOKUP = {
+    TokenType.VARIABLES: [
+        VariablesSectionGrammar,
+        long_description_parse,
+    ],
+    TokenType.ARGUMENTS: [
+        ArgumentsGrammar,
+        long_description_parse,
+    ],
+    TokenType.ARGUMENT_TYPE: [
+        ArgumentTypeGrammar,
+        long_description_parse,
+    ],
+    TokenType.VARIABLE_TYPE: [
+        VariableTypeGrammar,
+        long_description_parse,
+    ],
+    TokenType.RAISES: [
+        RaisesGrammar,
+        long_description_parse,
+    ],
+    TokenType.YIELDS: [
+        YieldsGrammar,
+        long_description_parse,
+    ],
+    TokenType.YIELD_TYPE: [
+        YieldTypeGrammar,
+        long_description_parse,
+    ],
+    TokenType.RETURNS: [
+        ReturnsGrammar,
+        long_description_parse,
+    ],
+    TokenType.RETURN_TYPE: [
+        ReturnTypeGrammar,
+        long_description_parse,
+    ],
+}
+
+
 def _match(token):
     """Match the given token from the given section to a set of grammars.
 
@@ -96,45 +138,11 @@ def _match(token):
         A list of grammars to be tried in order.
 
     """
-    tt_lookup = {
-        TokenType.VARIABLES: [
-            VariablesSectionGrammar,
-            long_description_parse,
-        ],
-        TokenType.ARGUMENTS: [
-            ArgumentsGrammar,
-            long_description_parse,
-        ],
-        TokenType.ARGUMENT_TYPE: [
-            ArgumentTypeGrammar,
-            long_description_parse,
-        ],
-        TokenType.VARIABLE_TYPE: [
-            VariableTypeGrammar,
-            long_description_parse,
-        ],
-        TokenType.RAISES: [
-            RaisesGrammar,
-            long_description_parse,
-        ],
-        TokenType.YIELDS: [
-            YieldsGrammar,
-            long_description_parse,
-        ],
-        TokenType.YIELD_TYPE: [
-            YieldTypeGrammar,
-            long_description_parse,
-        ],
-        TokenType.RETURNS: [
-            ReturnsGrammar,
-            long_description_parse,
-        ],
-        TokenType.RETURN_TYPE: [
-            ReturnTypeGrammar,
-            long_description_parse,
-        ],
-    }
-    return tt_lookup.get(token.token_type, [long_description_parse])
+    # Return a copy, since `lookup` inserts the short
+    # description grammar into the list.
+    return list(
+        _TT_LOOKUP.get(token.token_type, [long_description_parse])
+    )
 
 
 def lookup(section, section_index=-1):
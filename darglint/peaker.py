@@ -35,7 +35,7 @@ class Peaker(Generic[T]):
 
         """
         self.stream = stream
-        self.buffer = deque()  # type: deque
+        self.buffer = deque(maxlen=lookahead)  # type: deque
         self.lookahead = lookahead
         self._buffer_to(lookahead)
 
@@ -83,7 +83,12 @@ class Peaker(Generic[T]):
         if len(self.buffer) == 0:
             raise StopIteration
         self.prev = self.buffer.pop()
-        self._buffer_to(self.lookahead)
+
+        # The buffer was full (unless the stream was exhausted), so
+        # only a single item is needed to refill it.
+        item = next(self.stream, self._Empty)
+        if item is not self._Empty:
+            self.buffer.appendleft(item)
         return self.prev
 
     def peak(self, lookahead=1):
@@ -110,8 +115,7 @@ class Peaker(Generic[T]):
             )
         if lookahead > len(self.buffer):
             return None
-        index = len(self.buffer) - lookahead
-        return self.buffer[index]
+        return self.buffer[-lookahead]
 
     def rpeak(self, lookahead=1):
         # type: (int) -> T
@@ -138,8 +142,7 @@ class Peaker(Generic[T]):
             )
         if lookahead > len(self.buffer):
             raise IndexError
-        index = len(self.buffer) - lookahead
-        return self.buffer[index]
+        return self.buffer[-lookahead]
 
     def has_next(self):
         # type: () -> bool
@@ -64,6 +64,12 @@ KEYWORDS = {
 class Token(object):
     """A token representing anything which can appear in a docstring."""
 
+    __slots__ = (
+        'value',
+        'token_type',
+        'line_number',
+    )
+
     def __init__(self,
                  value: str,
                  token_type: TokenType,